@@ -2,7 +2,7 @@
 from config.settings import settings
 import os, litellm
 
-def chat_completion(messages):
+def chat_completion(messages, timeout=None):
     provider = settings.llm_provider.lower()
 
     # mock mode if no key or provider explicitly "mock"
@@ -14,10 +14,10 @@ def chat_completion(messages):
         os.environ["OPENAI_PROJECT_ID"] = settings.openai_project_id
 
     if provider == "openai":
-        return litellm.completion(model=settings.openai_model, messages=messages)
+        return litellm.completion(model=settings.openai_model, messages=messages, timeout=timeout)
 
     if provider == "ollama":
-        return litellm.completion(model=f"ollama/{settings.ollama_model}", messages=messages)
+        return litellm.completion(model=f"ollama/{settings.ollama_model}", messages=messages, timeout=timeout)
 
     # fallback mock
     return {"choices":[{"message":{"content":"{\"paragraphs\":[\"Fallback 1\",\"Fallback 2\",\"Fallback 3\"],\"whats_new\":[\"A\",\"B\"],\"open_problems\":[\"C\"],\"top5_papers\":[{\"title\":\"T\",\"url\":\"U\"}]}"}}]}
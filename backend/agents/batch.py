@@ -0,0 +1,159 @@
+# agents/batch.py
+import concurrent.futures
+import time
+from typing import Dict, Iterator, List
+
+from agents.summarizer import make_summary, DEFAULT, SummaryUnavailable
+from agents.evaluator import evaluate_summaries
+from agents.deadline import DeadlineExceeded, stage_budgets, stage_entry
+from config.settings import settings
+from retrieval.main import retrieve_papers
+from retrieval.sources import report_status
+
+
+def _query_key(item: Dict):
+    return (" ".join(item["query"].lower().split()), item["n_papers"], tuple(item["sources"]))
+
+
+BATCH_EXPIRED = "batch deadline exceeded"
+
+
+def _capped(stage_budget: float, expires: float | None) -> float:
+    """Trim a stage budget (when the worker starts) so it never outlives the batch deadline."""
+    if expires is None:
+        return stage_budget
+    left = expires - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded(BATCH_EXPIRED)
+    return min(stage_budget, left)
+
+
+def _retrieve(stage_budget: float, expires: float | None, query: str, n: int, sources):
+    stage_budget = _capped(stage_budget, expires)
+    t0 = time.monotonic()
+    papers, source_report = retrieve_papers(query, n, sources, budget_s=stage_budget)
+    stage = stage_entry(stage_budget, time.monotonic() - t0, report_status(source_report))
+    return (papers, source_report), stage
+
+
+def _summarize(stage_budget: float, expires: float | None, papers):
+    stage_budget = _capped(stage_budget, expires)
+    t0 = time.monotonic()
+    try:
+        summary, status = make_summary(papers, timeout=stage_budget, strict=True), None
+    except SummaryUnavailable as e:
+        summary, status = DEFAULT, e.status
+    return summary, stage_entry(stage_budget, time.monotonic() - t0, status)
+
+
+def run_batch(items: List[Dict], max_concurrency: int | None = None, deadline_s: float | None = None) -> Iterator[Dict]:
+    """
+    Summarize many topics in one pass and yield per-topic results as they finish.
+
+    - identical (query, n_papers, sources) triples are retrieved once
+    - each topic gets exactly the papers its own sources returned; abstracts
+      repeated across topics are only tokenized once during evaluation
+    - arXiv calls go through the shared limiter in retrieval.arxiv_client
+    - LLM calls run with bounded concurrency
+    - every group of finished topics is evaluated in one vectorized pass
+
+    Each topic's stages get the same budgets a single request would
+    (item deadline_s split by stage_budgets). `deadline_s` bounds the whole
+    batch: once it passes, unfinished topics are cancelled and reported, and
+    no stage (including an LLM call already running) is given time past it.
+    Closing the generator early (client gone) cancels queued work too.
+    """
+    llm_workers = max(1, max_concurrency or settings.batch_llm_concurrency)
+    retrieval_workers = max(1, settings.batch_retrieval_concurrency)
+    if deadline_s is None or (settings.batch_deadline_s and deadline_s > settings.batch_deadline_s):
+        deadline_s = settings.batch_deadline_s
+    expires = time.monotonic() + deadline_s if deadline_s else None
+
+    topics_by_query: Dict[tuple, List[int]] = {}
+    for i, item in enumerate(items):
+        topics_by_query.setdefault(_query_key(item), []).append(i)
+
+    budgets = [stage_budgets(item.get("deadline_s")) for item in items]
+
+    retrieval_pool = concurrent.futures.ThreadPoolExecutor(max_workers=retrieval_workers)
+    llm_pool = concurrent.futures.ThreadPoolExecutor(max_workers=llm_workers)
+    try:
+        # future -> ("retrieve", query_key) | ("summarize", topic index, papers, source report, stages)
+        pending = {}
+        for key, indices in topics_by_query.items():
+            first = items[indices[0]]
+            budget = budgets[indices[0]]["retrieval"]
+            fut = retrieval_pool.submit(_retrieve, budget, expires, first["query"], first["n_papers"], key[2])
+            pending[fut] = ("retrieve", key)
+
+        while pending:
+            timeout = None if expires is None else max(0.0, expires - time.monotonic())
+            done, _ = concurrent.futures.wait(pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            if not done:
+                # batch deadline passed: report everything still outstanding
+                for fut, job in pending.items():
+                    fut.cancel()
+                    indices = topics_by_query[job[1]] if job[0] == "retrieve" else [job[1]]
+                    for i in indices:
+                        yield {"index": i, "query": items[i]["query"], "error": BATCH_EXPIRED}
+                return
+
+            finished = []
+            for fut in done:
+                job = pending.pop(fut)
+
+                if job[0] == "retrieve":
+                    indices = topics_by_query[job[1]]
+                    try:
+                        (papers, source_report), retrieval_stage = fut.result()
+                    except Exception as e:
+                        for i in indices:
+                            yield {"index": i, "query": items[i]["query"], "error": str(e)}
+                        continue
+                    if expires is not None and time.monotonic() >= expires:
+                        for i in indices:
+                            yield {"index": i, "query": items[i]["query"], "error": BATCH_EXPIRED}
+                        continue
+                    for i in indices:
+                        budget = budgets[i]["summarize"]
+                        llm_fut = llm_pool.submit(_summarize, budget, expires, papers)
+                        pending[llm_fut] = ("summarize", i, papers, source_report, {"retrieval": retrieval_stage})
+                    continue
+
+                _, i, papers, source_report, stages = job
+                try:
+                    summary, stages["summarize"] = fut.result()
+                    finished.append((i, summary, papers, source_report, stages))
+                except Exception as e:
+                    yield {"index": i, "query": items[i]["query"], "error": str(e)}
+
+            if not finished:
+                continue
+
+            t0 = time.monotonic()
+            scores = evaluate_summaries(
+                [summary for _, summary, _, _, _ in finished],
+                [papers for _, _, papers, _, _ in finished],
+            )
+            # one shared pass; charge each topic its share
+            eval_used = (time.monotonic() - t0) / len(finished)
+
+            for (i, summary, papers, source_report, stages), eval_scores in zip(finished, scores):
+                stages["evaluate"] = stage_entry(budgets[i]["evaluate"], eval_used)
+                yield {
+                    "index": i,
+                    "query": items[i]["query"],
+                    "summary": summary,
+                    "eval": eval_scores,
+                    "papers": papers,
+                    "sources": source_report,
+                    "budget": {
+                        "budget_s": round(sum(budgets[i].values()), 3),
+                        "degraded": any(s["status"] != "ok" for s in stages.values()),
+                        "stages": stages,
+                    },
+                }
+    finally:
+        retrieval_pool.shutdown(wait=False, cancel_futures=True)
+        llm_pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,105 @@
+# agents/deadline.py
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+from config.settings import settings
+
+# relative share of the request budget each stage may use
+STAGE_WEIGHTS = {
+    "retrieval": 0.25,
+    "summarize": 0.65,
+    "evaluate": 0.10,
+}
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a stage is about to start but the request budget is gone."""
+
+
+def stage_entry(budget_s: float, used_s: float, status: str | None = None) -> Dict:
+    """`status` overrides the time-based verdict (a stage that fell back early)."""
+    return {
+        "budget_s": round(budget_s, 3),
+        "used_s": round(used_s, 3),
+        "status": status or ("ok" if used_s < budget_s else "timeout"),
+    }
+
+
+def request_budget(budget_s: float | None = None) -> float:
+    """A client's deadline_s, never longer than REQUEST_DEADLINE_S."""
+    if budget_s is None:
+        return settings.request_deadline_s
+    return min(budget_s, settings.request_deadline_s)
+
+
+def stage_budgets(budget_s: float | None = None, weights=STAGE_WEIGHTS) -> Dict[str, float]:
+    """Static split of a budget across stages, for work that waits in a queue (batches)."""
+    budget_s = request_budget(budget_s)
+    total = sum(weights.values())
+    return {name: budget_s * w / total for name, w in weights.items()}
+
+
+class Deadline:
+    """
+    Request-scoped time budget.
+
+    Each stage gets its weighted share of whatever time is left, so time
+    a fast stage doesn't use rolls over to the later ones.
+    """
+
+    def __init__(self, budget_s: float | None = None, weights=STAGE_WEIGHTS):
+        self.budget_s = request_budget(budget_s)
+        self.weights = dict(weights)
+        self.start = time.monotonic()
+        self.expires = self.start + self.budget_s
+        self.stages: Dict[str, Dict] = {}
+        self._marks: Dict[str, str] = {}
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def degrade(self, name: str, status: str):
+        """Flag a stage as timed out / failed even if it returned within budget."""
+        self._marks[name] = status
+
+    def stage_budget(self, name: str) -> float:
+        left = [n for n in self.weights if n not in self.stages]
+        total = sum(self.weights[n] for n in left)
+        if not total:
+            return self.remaining()
+        return self.remaining() * self.weights.get(name, 0) / total
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Yields the stage budget (seconds) and records how much of it was used.
+        Raises DeadlineExceeded up front if the request budget is already spent.
+        """
+        if self.expired():
+            self.stages[name] = {"budget_s": 0.0, "used_s": 0.0, "status": "skipped"}
+            raise DeadlineExceeded(name)
+
+        budget = self.stage_budget(name)
+        self.stages[name] = {"budget_s": round(budget, 3), "used_s": None, "status": "running"}
+        t0 = time.monotonic()
+        try:
+            yield budget
+        except Exception:
+            self.stages[name] = {**stage_entry(budget, time.monotonic() - t0), "status": "error"}
+            raise
+        self.stages[name] = stage_entry(budget, time.monotonic() - t0, self._marks.get(name))
+
+    def report(self) -> Dict:
+        stages = dict(self.stages)
+        for name in self.weights:
+            stages.setdefault(name, {"budget_s": 0.0, "used_s": 0.0, "status": "skipped"})
+        return {
+            "budget_s": round(self.budget_s, 3),
+            "elapsed_s": round(time.monotonic() - self.start, 3),
+            "degraded": any(s["status"] != "ok" for s in stages.values()),
+            "stages": stages,
+        }
@@ -2,8 +2,9 @@
 
 import numpy as np
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 
 
 def clean_text(text):
@@ -33,6 +34,48 @@ def compute_coverage(summary_text, references):
         return 0.0
 
 
+def compute_coverage_batch(summary_texts, references_list):
+    """
+    Batched version of compute_coverage.
+
+    Tokenizes every unique document once with a shared vocabulary, then
+    applies per-topic IDF weights on the sparse count rows, so each score
+    matches what compute_coverage would return for that topic alone.
+    """
+    docs, index = [], {}
+
+    def row(text):
+        text = clean_text(text)
+        if text not in index:
+            index[text] = len(docs)
+            docs.append(text)
+        return index[text]
+
+    groups = [(row(s), [row(r) for r in refs]) for s, refs in zip(summary_texts, references_list)]
+
+    try:
+        counts = CountVectorizer().fit_transform(docs).tocsr()
+    except Exception:
+        return [0.0] * len(groups)
+
+    scores = []
+    for summary_row, ref_rows in groups:
+        if not ref_rows:
+            scores.append(0.0)
+            continue
+
+        sub = counts[[summary_row] + ref_rows]
+        n_docs = sub.shape[0]
+        df = np.bincount(sub.indices, minlength=sub.shape[1])
+        # same smoothing as TfidfVectorizer defaults
+        idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+        tfidf = normalize(sub.multiply(idf).tocsr())
+        similarities = (tfidf[1:] @ tfidf[0].T).toarray().ravel()
+        scores.append(float(np.mean(similarities)))
+
+    return scores
+
+
 def compute_depth(summary_text):
     """
     Measures detail level based on:
@@ -93,6 +136,37 @@ def evaluate_summary(summary, papers):
     depth = compute_depth(summary_text)
     structure = compute_structure(summary)
 
+    return _scores(coverage, depth, structure)
+
+
+def evaluate_summaries(summaries, papers_list):
+    """
+    Evaluates many (summary, papers) pairs with a single vectorizer pass.
+    Returns one score dict per pair, identical to evaluate_summary.
+    """
+    results = [None] * len(summaries)
+    pending = []
+
+    for i, (summary, papers) in enumerate(zip(summaries, papers_list)):
+        summary_text = " ".join(summary.get("paragraphs", []))
+        if not summary_text.strip():
+            results[i] = {"coverage": 0, "depth": 0, "structure": 0, "overall": 0}
+            continue
+        references = [p.get("abstract", "") for p in papers if p.get("abstract")]
+        pending.append((i, summary, summary_text, references))
+
+    coverages = compute_coverage_batch(
+        [text for _, _, text, _ in pending],
+        [refs for _, _, _, refs in pending],
+    )
+
+    for (i, summary, summary_text, _), coverage in zip(pending, coverages):
+        results[i] = _scores(coverage, compute_depth(summary_text), compute_structure(summary))
+
+    return results
+
+
+def _scores(coverage, depth, structure):
     overall = (
         0.4 * coverage +
         0.3 * depth +
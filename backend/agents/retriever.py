@@ -1,15 +1,13 @@
 
 from typing import Dict, List
-from retrieval.arxiv_client import search_arxiv
 from retrieval.normalize import dedupe
+from retrieval.sources import search_sources
 
 def fetch_papers(plan: Dict, n: int = 8, sources: List[str] = ["arxiv"]):
     q_terms = plan.get("keywords") or []
     query = " ".join(q_terms) if q_terms else plan.get("raw", "")
-    papers = []
 
-    if "arxiv" in sources:
-        papers += search_arxiv(query, max_results=max(n*2, 12))
+    papers, _ = search_sources(query, max_results=max(n*2, 12), sources=sources)
 
     papers = dedupe(papers)
     return papers[:n]
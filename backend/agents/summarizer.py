@@ -15,6 +15,19 @@ DEFAULT = {
     "top5_papers": [],
 }
 
+class SummaryUnavailable(Exception):
+    """LLM call timed out or failed; `status` is "timeout" or "error"."""
+
+    def __init__(self, status: str, reason: str):
+        super().__init__(reason)
+        self.status = status
+
+
+def _is_timeout(e: Exception) -> bool:
+    # futures timeout, builtin timeout, or a provider's own Timeout class (litellm.Timeout)
+    return isinstance(e, (concurrent.futures.TimeoutError, TimeoutError)) or "timeout" in type(e).__name__.lower()
+
+
 def safe_load_json(text: str):
     """Attempts multiple parses until valid JSON is extracted."""
     try:
@@ -61,8 +74,14 @@ KEYWORDS: {", ".join(p.get("keywords", [])) if p.get("keywords") else ""}
     return "\n".join(chunks)
 
 
-def make_summary(papers):
-    """Generate structured JSON summary with strong fallback."""
+def make_summary(papers, timeout=120, strict=False):
+    """Generate structured JSON summary with strong fallback.
+
+    `timeout` bounds the LLM call; on expiry DEFAULT is returned right away
+    (the worker is abandoned, not waited on). With `strict=True` a timed-out
+    or failed LLM call raises SummaryUnavailable instead, so callers can
+    report the fallback.
+    """
     
     if not papers:
         return DEFAULT
@@ -110,15 +129,19 @@ RULES:
         },
     ]
 
+    ex = concurrent.futures.ThreadPoolExecutor(max_workers=1)
     try:
-        with concurrent.futures.ThreadPoolExecutor() as ex:
-            future = ex.submit(chat_completion, messages)
-            out = future.result(timeout=120)
+        future = ex.submit(chat_completion, messages, timeout)
+        out = future.result(timeout=timeout)
 
         content = out["choices"][0]["message"]["content"]
 
     except Exception as e:
+        if strict:
+            raise SummaryUnavailable("timeout" if _is_timeout(e) else "error", str(e) or type(e).__name__) from e
         return DEFAULT
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
 
     # --- JSON PARSE ---
     parsed = safe_load_json(content)
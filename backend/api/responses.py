@@ -0,0 +1,201 @@
+# api/responses.py
+"""
+Response encoding for the summarize routes.
+
+- `fields=summary,eval,papers.title` keeps only the listed (dotted) paths;
+  a path through a list applies to every element.
+- JSON is encoded with orjson when available, MessagePack when the client
+  sends `Accept: application/x-msgpack`.
+- bodies are compressed with brotli or gzip per `Accept-Encoding`.
+"""
+import gzip
+import json
+import zlib
+from typing import Dict, Iterable
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MSGPACK_TYPES = ("application/x-msgpack", "application/msgpack")
+MIN_COMPRESS_BYTES = 512
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4  # fast setting meant for dynamic content
+STREAM_KEEP = ("index", "error")  # batch rows keep these whatever `fields` says
+
+
+# ---------- projection ----------
+
+def parse_fields(fields: str | None) -> Dict | None:
+    """'a,b.c' -> {'a': None, 'b': {'c': None}}; None means keep everything below."""
+    if not fields:
+        return None
+    tree: Dict = {}
+    for path in fields.split(","):
+        parts = [p for p in path.strip().split(".") if p]
+        if not parts:
+            continue
+        node = tree
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                break  # parent already kept whole
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return tree or None
+
+
+def project(data, tree: Dict | None):
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [project(d, tree) for d in data]
+    if not isinstance(data, dict):
+        return data
+    return {k: project(data[k], sub) for k, sub in tree.items() if k in data}
+
+
+# ---------- encoding ----------
+
+def _parse_qlist(header: str | None) -> Dict[str, float]:
+    """'a, b;q=0.5' -> {'a': 1.0, 'b': 0.5} (Accept / Accept-Encoding style)."""
+    offered = {}
+    for token in (header or "").split(","):
+        name, *params = [part.strip() for part in token.split(";")]
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        offered[name.lower()] = q
+    return offered
+
+
+def _wants_msgpack(request: Request) -> bool:
+    """MessagePack only if explicitly accepted and not ranked below JSON."""
+    if msgpack is None:
+        return False
+    offered = _parse_qlist(request.headers.get("accept"))
+    msgpack_q = max(offered.get(t, 0.0) for t in MSGPACK_TYPES)
+    json_q = max(offered.get(t, 0.0) for t in ("application/json", "application/*", "*/*"))
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+def _encode_json(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def encode(data, use_msgpack: bool = False) -> bytes:
+    if use_msgpack:
+        return msgpack.packb(data, use_bin_type=True)
+    return _encode_json(data)
+
+
+def choose_encoding(accept_encoding: str | None) -> str | None:
+    """Pick 'br' or 'gzip' from an Accept-Encoding header (br preferred on ties)."""
+    offered = _parse_qlist(accept_encoding)
+
+    candidates = [("br", brotli is not None), ("gzip", True)]
+    best, best_q = None, 0.0
+    for name, available in candidates:
+        q = offered.get(name, offered.get("*", 0.0))
+        if available and q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def compress(body: bytes, encoding: str | None) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return body
+
+
+def render(data, request: Request, fields: str | None = None) -> Response:
+    use_msgpack = _wants_msgpack(request)
+    body = encode(project(data, parse_fields(fields)), use_msgpack)
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    if encoding and len(body) >= MIN_COMPRESS_BYTES:
+        body = compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+
+    media_type = MSGPACK_TYPES[0] if use_msgpack else "application/json"
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+# ---------- streaming (batch) ----------
+
+class _StreamCompressor:
+    """Compresses a stream chunk by chunk, flushing so each item is readable on arrival."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._c = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._chunk = lambda b: self._c.process(b) + self._c.flush()
+            self._end = self._c.finish
+        else:
+            self._c = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # 31 = gzip container
+            self._chunk = lambda b: self._c.compress(b) + self._c.flush(zlib.Z_SYNC_FLUSH)
+            self._end = self._c.flush
+
+    def chunk(self, body: bytes) -> bytes:
+        return self._chunk(body)
+
+    def end(self) -> bytes:
+        return self._end()
+
+
+def render_stream(items: Iterable, request: Request, fields: str | None = None) -> StreamingResponse:
+    """
+    NDJSON (or concatenated MessagePack objects) with optional streaming compression.
+    Rows always keep `index` and `error` so failures stay visible under projection.
+    """
+    use_msgpack = _wants_msgpack(request)
+    tree = parse_fields(fields)
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+
+    def frames():
+        for item in items:
+            row = project(item, tree)
+            if tree is not None:
+                row.update({k: item[k] for k in STREAM_KEEP if k in item})
+            body = encode(row, use_msgpack)
+            yield body if use_msgpack else body + b"\n"
+
+    def body():
+        if not encoding:
+            yield from frames()
+            return
+        compressor = _StreamCompressor(encoding)
+        for frame in frames():
+            yield compressor.chunk(frame)
+        yield compressor.end()
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    media_type = MSGPACK_TYPES[0] if use_msgpack else "application/x-ndjson"
+    return StreamingResponse(body(), media_type=media_type, headers=headers)
@@ -1,7 +1,13 @@
-from fastapi import APIRouter
-from pydantic import BaseModel
-from agents.summarizer import make_summary
+from fastapi import APIRouter, Request
+from pydantic import BaseModel, Field
+from typing import List
+from agents.summarizer import make_summary, DEFAULT, SummaryUnavailable
+from agents.deadline import Deadline, DeadlineExceeded
 from agents.evaluator import evaluate_summary
+from agents.batch import run_batch
+from api.schemas import SummarizeBatchReq
+from api.responses import render, render_stream
+from retrieval.sources import report_status
 import logging, json
 
 router = APIRouter()
@@ -9,33 +15,76 @@ router = APIRouter()
 class Query(BaseModel):
     query: str
     n_papers: int = 5
-    sources: list = ["arxiv"]
+    sources: List[str] = ["arxiv"]
+    deadline_s: float | None = Field(None, gt=0)  # capped at settings.request_deadline_s
 
 @router.post("/summarize")
-def summarize(q: Query):
+def summarize(q: Query, request: Request, fields: str | None = None):
+    """
+    `fields` projects the response, e.g. `summary,eval,papers.title`.
+    Send `Accept: application/x-msgpack` for MessagePack; gzip/br per Accept-Encoding.
+    """
     logging.basicConfig(level=logging.INFO)
 
     # TEMP MARKER
     logging.info("=== /summarize endpoint called ===")
 
-    # Retrieve papers (your existing retrieval pipeline)
-    from retrieval.main import retrieve_papers
-    papers = retrieve_papers(q.query, q.n_papers)
+    # Every stage gets a slice of the request budget; once it is spent the
+    # remaining stages are skipped and whatever we have is returned.
+    deadline = Deadline(q.deadline_s)
+    papers, source_report = [], {}
+    summary, eval_scores = DEFAULT, None
 
-    logging.info("PAPERS RETRIEVED: " + str(len(papers)))
+    try:
+        # Retrieve papers (your existing retrieval pipeline)
+        from retrieval.main import retrieve_papers
+        with deadline.stage("retrieval") as budget:
+            papers, source_report = retrieve_papers(q.query, q.n_papers, q.sources, budget_s=budget)
+            retrieval_status = report_status(source_report)
+            if retrieval_status:
+                deadline.degrade("retrieval", retrieval_status)
 
-    summary = make_summary(papers)
+        logging.info("PAPERS RETRIEVED: " + str(len(papers)))
+        logging.info("SOURCES: " + json.dumps(source_report))
 
-    logging.info("SUMMARY RAW:")
-    logging.info(json.dumps(summary, indent=2))
+        with deadline.stage("summarize") as budget:
+            try:
+                summary = make_summary(papers, timeout=budget, strict=True)
+            except SummaryUnavailable as e:
+                logging.warning(f"Summary fell back to default ({e.status}): {e}")
+                deadline.degrade("summarize", e.status)
 
-    eval_scores = evaluate_summary(summary, papers)
+        logging.info("SUMMARY RAW:")
+        logging.info(json.dumps(summary, indent=2))
 
-    logging.info("EVAL RAW:")
-    logging.info(json.dumps(eval_scores, indent=2))
+        with deadline.stage("evaluate"):
+            eval_scores = evaluate_summary(summary, papers)
 
-    return {
+        logging.info("EVAL RAW:")
+        logging.info(json.dumps(eval_scores, indent=2))
+
+    except DeadlineExceeded as e:
+        logging.warning(f"Deadline exceeded before stage '{e}', returning partial result")
+
+    return render({
         "summary": summary,
         "eval": eval_scores,
         "papers": papers,
-    }
+        "sources": source_report,
+        "budget": deadline.report(),
+    }, request, fields)
+
+
+@router.post("/summarize/batch")
+def summarize_batch(req: SummarizeBatchReq, request: Request, fields: str | None = None):
+    """
+    Summarize many topics in one request.
+    Streams one JSON object per line (NDJSON) as each topic completes;
+    `index` points back into `items`. `fields`, MessagePack and compression
+    work as on /summarize (projection applies per topic).
+    """
+    logging.info(f"=== /summarize/batch called with {len(req.items)} topics ===")
+
+    items = [item.model_dump() for item in req.items]
+
+    return render_stream(run_batch(items, req.max_concurrency, req.deadline_s), request, fields)
@@ -11,6 +11,12 @@ class SummarizeReq(BaseModel):
     n_papers: int = 8
     date_range: Optional[DateRange] = None
     sources: List[str] = ["arxiv"]
+    deadline_s: Optional[float] = Field(None, gt=0)  # capped at settings.request_deadline_s
+
+class SummarizeBatchReq(BaseModel):
+    items: List[SummarizeReq] = Field(..., min_length=1)
+    max_concurrency: Optional[int] = Field(None, ge=1)  # LLM calls in flight
+    deadline_s: Optional[float] = Field(None, gt=0)  # whole batch; capped at settings.batch_deadline_s when set
 
 class Paper(BaseModel):
     title: str
@@ -14,4 +14,25 @@ class Settings(BaseModel):
     host: str = os.getenv("HOST", "0.0.0.0")
     port: int = int(os.getenv("PORT", "8000"))
 
+    # end-to-end budget for one /summarize request, split across pipeline stages
+    request_deadline_s: float = float(os.getenv("REQUEST_DEADLINE_S", "150"))
+    # overall budget for a /summarize/batch call (unset = no limit)
+    batch_deadline_s: float | None = float(os.getenv("BATCH_DEADLINE_S")) if os.getenv("BATCH_DEADLINE_S") else None
+
+    # retrieval sources: each source gets its own deadline, capped by the overall budget
+    retrieval_budget_s: float = float(os.getenv("RETRIEVAL_BUDGET_S", "20"))
+    arxiv_timeout_s: float = float(os.getenv("ARXIV_TIMEOUT_S", "20"))
+    semantic_scholar_timeout_s: float = float(os.getenv("SEMANTIC_SCHOLAR_TIMEOUT_S", "10"))
+    openalex_timeout_s: float = float(os.getenv("OPENALEX_TIMEOUT_S", "10"))
+    arxiv_api: str = os.getenv("ARXIV_API", "http://export.arxiv.org/api/query")
+    semantic_scholar_api: str = os.getenv("SEMANTIC_SCHOLAR_API", "https://api.semanticscholar.org/graph/v1/paper/search")
+    semantic_scholar_api_key: str | None = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+    openalex_api: str = os.getenv("OPENALEX_API", "https://api.openalex.org/works")
+    openalex_mailto: str | None = os.getenv("OPENALEX_MAILTO")
+
+    # retrieval / batch tuning
+    arxiv_min_interval_s: float = float(os.getenv("ARXIV_MIN_INTERVAL_S", "3.0"))
+    batch_llm_concurrency: int = int(os.getenv("BATCH_LLM_CONCURRENCY", "8"))
+    batch_retrieval_concurrency: int = int(os.getenv("BATCH_RETRIEVAL_CONCURRENCY", "4"))
+
 settings = Settings()
@@ -1,11 +1,35 @@
 
 import requests
+import threading
+import time
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from config.settings import settings
 
-ARXIV_API = "http://export.arxiv.org/api/query"
+ARXIV_API = settings.arxiv_api
 
-def search_arxiv(query: str, max_results=12, start=0, categories=("cs.LG","cs.AI")):
+# process-wide limiter shared by every caller (single + batch requests)
+_rate_lock = threading.Lock()
+_next_slot = 0.0
+
+def _wait_for_slot(max_wait=None):
+    """
+    Block until the next arXiv call is allowed (arXiv asks for ~1 call / 3s).
+    If that is more than `max_wait` seconds away, raise TimeoutError without
+    booking the slot. Returns the seconds spent waiting.
+    """
+    global _next_slot
+    with _rate_lock:
+        now = time.monotonic()
+        wait = max(0.0, _next_slot - now)
+        if max_wait is not None and wait >= max_wait:
+            raise TimeoutError(f"arXiv rate limit: next slot in {wait:.1f}s, only {max_wait:.1f}s left")
+        _next_slot = now + wait + settings.arxiv_min_interval_s
+    if wait > 0:
+        time.sleep(wait)
+    return wait
+
+def search_arxiv(query: str, max_results=12, start=0, categories=("cs.LG","cs.AI"), timeout=20, fallback=True):
     if not query:
         query = "machine learning"
     q = f'all:"{query}"'
@@ -20,10 +44,13 @@ def search_arxiv(query: str, max_results=12, start=0, categories=("cs.LG","cs.AI
         "sortOrder": "descending"
     }
     try:
-        r = requests.get(ARXIV_API, params=params, timeout=20)
+        waited = _wait_for_slot(max_wait=timeout)
+        r = requests.get(ARXIV_API, params=params, timeout=timeout - waited)
         r.raise_for_status()
         return parse_arxiv_atom(r.text)
     except Exception:
+        if not fallback:
+            raise
         # Offline fallback minimal mock
         return [{
             "title": "Mock arXiv Paper",
@@ -1,9 +1,10 @@
 # backend/retrieval/main.py
 
-from .arxiv_client import search_arxiv
 from .normalize import dedupe
+from .sources import search_sources
 
-def retrieve_papers(query: str, n: int):
-    results = search_arxiv(query, max_results=n)
+def retrieve_papers(query: str, n: int, sources=("arxiv",), budget_s=None):
+    """Returns (papers, source_report); see sources.search_sources."""
+    results, report = search_sources(query, max_results=n, sources=list(sources), budget_s=budget_s)
     results = dedupe(results)
-    return results
+    return results[:n], report
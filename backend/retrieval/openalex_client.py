@@ -0,0 +1,40 @@
+
+import requests
+from config.settings import settings
+
+def search_openalex(query: str, max_results=12, timeout=10):
+    if not query:
+        query = "machine learning"
+    params = {"search": query, "per-page": max_results}
+    if settings.openalex_mailto:
+        params["mailto"] = settings.openalex_mailto
+    r = requests.get(settings.openalex_api, params=params, timeout=timeout)
+    r.raise_for_status()
+    return parse_openalex(r.json())
+
+def rebuild_abstract(inverted_index):
+    """OpenAlex ships abstracts as {word: [positions]}; put the words back in order."""
+    if not inverted_index:
+        return ""
+    words = {}
+    for word, positions in inverted_index.items():
+        for pos in positions:
+            words[pos] = word
+    return " ".join(words[i] for i in sorted(words))
+
+def parse_openalex(payload: dict):
+    results = []
+    for item in payload.get("results") or []:
+        location = item.get("primary_location") or {}
+        results.append({
+            "title": (item.get("display_name") or item.get("title") or "").strip(),
+            "authors": [
+                (a.get("author") or {}).get("display_name", "")
+                for a in item.get("authorships") or []
+            ],
+            "year": item.get("publication_year"),
+            "abstract": rebuild_abstract(item.get("abstract_inverted_index")),
+            "url": location.get("landing_page_url") or item.get("doi") or item.get("id") or "",
+            "source": "openalex"
+        })
+    return results
@@ -0,0 +1,27 @@
+
+import requests
+from config.settings import settings
+
+FIELDS = "title,abstract,authors,year,url"
+
+def search_semantic_scholar(query: str, max_results=12, timeout=10):
+    if not query:
+        query = "machine learning"
+    params = {"query": query, "limit": max_results, "fields": FIELDS}
+    headers = {"x-api-key": settings.semantic_scholar_api_key} if settings.semantic_scholar_api_key else {}
+    r = requests.get(settings.semantic_scholar_api, params=params, headers=headers, timeout=timeout)
+    r.raise_for_status()
+    return parse_semantic_scholar(r.json())
+
+def parse_semantic_scholar(payload: dict):
+    results = []
+    for item in payload.get("data") or []:
+        results.append({
+            "title": (item.get("title") or "").strip(),
+            "authors": [a.get("name", "") for a in item.get("authors") or []],
+            "year": item.get("year"),
+            "abstract": (item.get("abstract") or "").strip(),
+            "url": item.get("url") or "",
+            "source": "semantic_scholar"
+        })
+    return results
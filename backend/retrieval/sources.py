@@ -0,0 +1,113 @@
+# backend/retrieval/sources.py
+
+import concurrent.futures
+import time
+from functools import partial
+from itertools import chain, zip_longest
+from typing import Callable, Dict, List
+
+from config.settings import settings
+from .arxiv_client import search_arxiv
+from .openalex_client import search_openalex
+from .semantic_scholar_client import search_semantic_scholar
+
+# A source adapter is any callable `(query, max_results, timeout) -> List[paper dict]`
+# that raises on failure; papers follow the arxiv_client dict shape.
+SOURCES: Dict[str, Callable] = {
+    "arxiv": partial(search_arxiv, fallback=False),
+    "semantic_scholar": search_semantic_scholar,
+    "openalex": search_openalex,
+}
+
+# Shared pool. Adapters get the time left until their deadline as `timeout`
+# (measured when the worker starts, so queueing here counts), so a call that
+# misses its deadline frees its worker shortly after; nobody waits on it.
+_pool = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="source")
+
+_timeouts: Dict[str, float] = {}
+
+
+def register_source(name: str, search: Callable, timeout_s: float | None = None):
+    """Plug in another source; its deadline defaults to settings.<name>_timeout_s."""
+    SOURCES[name] = search
+    if timeout_s is not None:
+        _timeouts[name] = timeout_s
+
+
+def source_timeout(name: str) -> float:
+    if name in _timeouts:
+        return _timeouts[name]
+    return getattr(settings, f"{name}_timeout_s", settings.retrieval_budget_s)
+
+
+def _run_source(search: Callable, query: str, max_results: int, deadline: float):
+    timeout = deadline - time.monotonic()
+    if timeout <= 0:
+        raise TimeoutError("deadline passed before the source call started")
+    return search(query, max_results, timeout=timeout)
+
+
+def report_status(report: Dict[str, Dict]) -> str | None:
+    """Worst outcome in a source report: "timeout", "error", or None when every source answered."""
+    statuses = {r["status"] for r in report.values()}
+    if "timeout" in statuses:
+        return "timeout"
+    if statuses - {"ok"}:
+        return "error"
+    return None
+
+
+def search_sources(query: str, max_results: int, sources: List[str], budget_s: float | None = None):
+    """
+    Queries every requested source concurrently. Each source gets its own
+    deadline (its timeout, capped by the overall budget); whatever has arrived
+    when a deadline passes is kept, the rest is dropped.
+
+    Returns (papers, report) where papers are interleaved across sources in
+    request order and report maps source -> {status, count, elapsed_s}.
+    """
+    # callers pass their stage budget; RETRIEVAL_BUDGET_S is always the ceiling
+    budget = settings.retrieval_budget_s if budget_s is None else min(budget_s, settings.retrieval_budget_s)
+    start = time.monotonic()
+    report: Dict[str, Dict] = {}
+    futures = {}
+
+    for name in dict.fromkeys(sources):
+        search = SOURCES.get(name)
+        if search is None:
+            report[name] = {"status": "unsupported", "count": 0, "elapsed_s": 0.0}
+            continue
+        timeout = max(0.0, min(source_timeout(name), budget))
+        fut = _pool.submit(_run_source, search, query, max_results, start + timeout)
+        futures[fut] = (name, start + timeout)
+
+    results: Dict[str, List[Dict]] = {}
+    pending = set(futures)
+    while pending:
+        now = time.monotonic()
+        for fut in [f for f in pending if futures[f][1] <= now and not f.done()]:
+            pending.discard(fut)
+            fut.cancel()
+            name, deadline = futures[fut]
+            report[name] = {"status": "timeout", "count": 0, "elapsed_s": round(deadline - start, 3)}
+        if not pending:
+            break
+
+        next_deadline = min(futures[f][1] for f in pending)
+        done, pending = concurrent.futures.wait(
+            pending, timeout=max(0.0, next_deadline - now), return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        elapsed = round(time.monotonic() - start, 3)
+        for fut in done:
+            name, _ = futures[fut]
+            try:
+                results[name] = fut.result()
+                report[name] = {"status": "ok", "count": len(results[name]), "elapsed_s": elapsed}
+            except Exception as e:
+                status = "timeout" if isinstance(e, TimeoutError) else "error"
+                report[name] = {"status": status, "count": 0, "elapsed_s": elapsed, "error": str(e)}
+
+    names = list(dict.fromkeys(sources))
+    ordered = [results[name] for name in names if name in results]
+    papers = [p for p in chain.from_iterable(zip_longest(*ordered)) if p is not None]
+    return papers, {name: report[name] for name in names}
@@ -0,0 +1,96 @@
+"""
+Bytes + encode time per /summarize response, before vs after.
+
+"before" = what the route used to do: FastAPI's jsonable_encoder, then Starlette's
+JSONResponse.render (compact separators, ensure_ascii=False), no compression.
+Run from backend/:  python scripts/bench_responses.py
+"""
+import gzip
+import json
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.encoders import jsonable_encoder
+from api.responses import brotli, compress, encode, msgpack, orjson, parse_fields, project
+
+UI_FIELDS = "summary,eval,budget,papers.title,papers.year,papers.authors,papers.url"
+ROUNDS = 2000
+
+
+def words(n, rng):
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(n))
+
+
+def sample_response(n_papers=8, seed=0):
+    rng = random.Random(seed)
+    papers = [{
+        "title": words(10, rng).title(),
+        "authors": [words(2, rng).title() for _ in range(5)],
+        "year": 2020 + i % 5,
+        "abstract": words(220, rng),
+        "url": f"http://arxiv.org/abs/2401.{10000 + i}",
+        "source": "arxiv",
+    } for i in range(n_papers)]
+    section = lambda k: [words(25, rng) for _ in range(k)]
+    summary = {
+        "paragraphs": section(4), "key_findings": section(5), "limitations": section(3),
+        "future_work": section(3), "methods": section(4), "whats_new": section(3),
+        "open_problems": section(3),
+        "top5_papers": [{"title": p["title"], "url": p["url"]} for p in papers[:5]],
+    }
+    return {
+        "summary": summary,
+        "eval": {"coverage": 0.41, "depth": 0.52, "structure": 1.0, "overall": 0.62},
+        "papers": papers,
+        "sources": {"arxiv": {"status": "ok", "count": n_papers, "elapsed_s": 1.2}},
+        "budget": {"budget_s": 150.0, "elapsed_s": 21.4, "degraded": False, "stages": {}},
+    }
+
+
+def starlette_render(content) -> bytes:
+    # copy of starlette.responses.JSONResponse.render
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def bench(name, fn):
+    body = fn()
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    us = (time.perf_counter() - t0) / ROUNDS * 1e6
+    print(f"{name:<40} {len(body):>8} B {us:>9.1f} us")
+
+
+def main():
+    data = sample_response()
+    ui = parse_fields(UI_FIELDS)
+
+    print(f"orjson={orjson is not None} msgpack={msgpack is not None} brotli={brotli is not None}\n")
+    print(f"{'variant':<40} {'bytes':>10} {'encode':>12}")
+    bench("before: jsonable_encoder + JSONResponse", lambda: starlette_render(jsonable_encoder(data)))
+    bench("json (fast encoder)", lambda: encode(data))
+    bench("json + gzip", lambda: compress(encode(data), "gzip"))
+    if brotli is not None:
+        bench("json + br", lambda: compress(encode(data), "br"))
+    bench("UI fields json", lambda: encode(project(data, ui)))
+    bench("UI fields json + gzip", lambda: compress(encode(project(data, ui)), "gzip"))
+    if brotli is not None:
+        bench("UI fields json + br", lambda: compress(encode(project(data, ui)), "br"))
+    if msgpack is not None:
+        bench("msgpack", lambda: encode(data, use_msgpack=True))
+        bench("UI fields msgpack + gzip", lambda: compress(encode(project(data, ui), use_msgpack=True), "gzip"))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,12 @@ import os
 API_URL = os.getenv("API_URL", "http://localhost:8000")
 api_url = f"{API_URL}/api/summarize"
 
+# server-side budget for one request; the HTTP timeout leaves headroom on top
+REQUEST_DEADLINE_S = float(os.getenv("REQUEST_DEADLINE_S", "150"))
+
+# only what the UI renders; skips full abstracts and the source report
+RESPONSE_FIELDS = "summary,eval,budget,papers.title,papers.year,papers.authors,papers.url"
+
 st.set_page_config(page_title="Automated Research Summarization", layout="wide")
 
 # ------------------- STYLING -------------------
@@ -53,6 +59,9 @@ st.markdown('<div class="subtitle">AI-powered summarizer for extracting insights
 # ------------------- INPUTS -------------------
 topic = st.text_input("Enter your topic", placeholder="e.g., Blockchain, Smart Watches, Federated Learning")
 n_papers = st.slider("Number of papers to include", 3, 12, 5)
+sources = st.multiselect(
+    "Sources", ["arxiv", "semantic_scholar", "openalex"], default=["arxiv"]
+)
 
 
 # ------------------- SUBMIT -------------------
@@ -67,8 +76,14 @@ if st.button("🚀 Generate Summary") and topic:
     try:
         resp = requests.post(
             api_url,
-            json={"query": topic, "n_papers": n_papers, "sources": ["arxiv"]},
-            timeout=180
+            params={"fields": RESPONSE_FIELDS},
+            json={
+                "query": topic,
+                "n_papers": n_papers,
+                "sources": sources or ["arxiv"],
+                "deadline_s": REQUEST_DEADLINE_S,
+            },
+            timeout=REQUEST_DEADLINE_S + 30
         )
 
         step_text.write("🧠 Running LLM summarizer...")
@@ -90,7 +105,12 @@ if st.button("🚀 Generate Summary") and topic:
         step_text.write("🎨 Rendering UI...")
         progress.progress(100)
 
-        st.success("✅ Summary generated successfully!")
+        budget = data.get("budget", {}) or {}
+        if budget.get("degraded"):
+            failed = [f"{k} ({v.get('status')})" for k, v in budget.get("stages", {}).items() if v.get("status") != "ok"]
+            st.warning(f"⏱️ Partial result: {', '.join(failed)}.")
+        else:
+            st.success("✅ Summary generated successfully!")
 
         # ------------------- TABS -------------------
         tab_summary, tab_details, tab_papers = st.tabs(